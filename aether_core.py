@@ -0,0 +1,308 @@
+import io
+import time
+
+import boto3
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+import tensorflow as tf
+from botocore.config import Config
+from fpdf import FPDF
+from tensorflow.keras.models import load_model
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pq = None
+    pacsv = None
+
+BUCKET_NAME = "aether-project-data"
+MODEL_FILE = "aether_brain_v2.h5"
+FILE_KEYS = [
+    "live_data.csv",
+    "telemetry_data.csv",
+    "telemetry_batch.csv",
+    "telemetry_batch_1.parquet",
+    "telemetry_batch_1.csv",
+]
+LOCAL_FALLBACK_FILES = [
+    "telemetry_batch_1.parquet",
+    "telemetry_batch_1.csv",
+]
+TELEMETRY_COLUMNS = [
+    "Time_Stamp",
+    "Time",
+    "Temperature_C",
+    "Temperature",
+    "Vibration_Hz",
+    "Vibration",
+]
+MAX_PLOT_POINTS = 1000
+
+
+def read_telemetry_csv(source) -> pd.DataFrame:
+    if pacsv is None:
+        return pd.read_csv(source)
+
+    if hasattr(source, "read"):
+        source = pa.PythonFile(source, mode="r")
+    table = pacsv.read_csv(source, read_options=pacsv.ReadOptions(use_threads=True))
+    return table.to_pandas()
+
+
+def read_telemetry_parquet(source) -> pd.DataFrame:
+    if pq is None:
+        return pd.DataFrame()
+
+    if hasattr(source, "read"):
+        source = io.BytesIO(source.read())
+    parquet_file = pq.ParquetFile(source)
+    columns = [name for name in TELEMETRY_COLUMNS if name in parquet_file.schema_arrow.names]
+    return parquet_file.read(columns=columns).to_pandas()
+
+
+def read_telemetry_file(source, file_key: str) -> pd.DataFrame:
+    if file_key.endswith(".parquet"):
+        return read_telemetry_parquet(source)
+    return read_telemetry_csv(source)
+
+
+def normalize_live_data(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty:
+        return df
+
+    df = df.rename(
+        columns={
+            "Time_Stamp": "Time",
+            "Temperature_C": "Temperature",
+            "Vibration_Hz": "Vibration",
+        }
+    ).copy()
+
+    if "Temperature" not in df.columns:
+        return pd.DataFrame()
+
+    if "Time" not in df.columns:
+        df["Time"] = [f"T-{idx}" for idx in range(len(df), 0, -1)]
+
+    if "Vibration" not in df.columns:
+        df["Vibration"] = np.nan
+
+    df["Temperature"] = pd.to_numeric(df["Temperature"], errors="coerce")
+    df["Vibration"] = pd.to_numeric(df["Vibration"], errors="coerce")
+    df = df.dropna(subset=["Temperature"]).reset_index(drop=True)
+    return df[["Time", "Temperature", "Vibration"]]
+
+
+def build_simulated_data(target_temp: float, points: int = 50) -> pd.DataFrame:
+    end_time = pd.Timestamp.now().floor("s")
+    times = pd.date_range(end=end_time, periods=points, freq="s")
+    normalized_temp = np.clip((target_temp - 80.0) / 70.0, 0.0, 1.0)
+    phase = np.linspace(0, 1, points)
+
+    if target_temp < 95:
+        base_trend = np.linspace(target_temp - 4.0, target_temp, points)
+        wave = np.sin(phase * 2.2 * np.pi) * 0.9
+    elif target_temp < 120:
+        base_trend = np.linspace(target_temp - 7.0, target_temp, points)
+        wave = (
+            np.sin(phase * 3.5 * np.pi) * (1.4 + normalized_temp * 1.2)
+            + np.sin(phase * 8.0 * np.pi) * 0.35
+        )
+    else:
+        base_trend = np.linspace(target_temp - 11.0, target_temp + 2.0, points)
+        spike = np.exp(-((phase - 0.72) ** 2) / 0.003) * (3.0 + normalized_temp * 2.5)
+        wave = np.sin(phase * 5.5 * np.pi) * (2.0 + normalized_temp * 1.5) + spike
+
+    temperature_values = np.round(base_trend + wave, 2).astype(float).tolist()
+    temperature_values[-1] = round(target_temp, 2)
+    vibration_values = 44 + normalized_temp * 18 + np.gradient(temperature_values) * 3.4 + np.cos(phase * 4 * np.pi) * 1.2
+
+    return pd.DataFrame(
+        {
+            "Time": times.strftime("%H:%M:%S"),
+            "Temperature": temperature_values,
+            "Vibration": np.round(np.clip(vibration_values, 35, 75), 2),
+        }
+    )
+
+
+def append_history(history_key: str, incoming: pd.DataFrame, limit: int = 50) -> pd.DataFrame:
+    if incoming.empty:
+        return pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
+
+    history = st.session_state.get(history_key)
+    if history is None or history.empty:
+        history = incoming.copy()
+    else:
+        history = pd.concat([history, incoming], ignore_index=True)
+
+    history["Temperature"] = pd.to_numeric(history["Temperature"], errors="coerce")
+    history["Vibration"] = pd.to_numeric(history["Vibration"], errors="coerce")
+    history = history.dropna(subset=["Temperature"]).tail(limit).reset_index(drop=True)
+    st.session_state[history_key] = history
+    return history
+
+
+def prepare_manual_history(target_temp: float) -> pd.DataFrame:
+    previous_temp = st.session_state.get("manual_target_temp")
+    if previous_temp is None or abs(previous_temp - target_temp) >= 0.25:
+        history = build_simulated_data(target_temp)
+    else:
+        history = st.session_state.get("manual_history")
+        if history is None or history.empty:
+            history = build_simulated_data(target_temp)
+
+    st.session_state["manual_target_temp"] = target_temp
+    st.session_state["manual_history"] = history
+    return history
+
+
+def prepare_live_history(df_cloud: pd.DataFrame) -> pd.DataFrame:
+    if df_cloud.empty:
+        return pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
+
+    latest = df_cloud.tail(min(len(df_cloud), 5)).copy().reset_index(drop=True)
+    current_times = pd.date_range(end=pd.Timestamp.now().floor("s"), periods=len(latest), freq="s")
+    latest["Time"] = current_times.strftime("%H:%M:%S")
+    return append_history("live_history", latest, limit=50)
+
+
+def build_prediction_sequence(df_live: pd.DataFrame, target_temp: float, length: int = 60) -> np.ndarray:
+    if df_live.empty:
+        return np.linspace(target_temp - 5, target_temp, length)
+
+    source = df_live["Temperature"].astype(float).to_numpy()
+    if len(source) == 1:
+        return np.full(length, source[0], dtype=float)
+
+    source_x = np.linspace(0, 1, len(source))
+    target_x = np.linspace(0, 1, length)
+    seq = np.interp(target_x, source_x, source)
+    seq[-1] = target_temp
+    return seq
+
+
+def downsample_minmax(y: np.ndarray, max_points: int = MAX_PLOT_POINTS):
+    if y.size <= max_points:
+        return None
+
+    bucket_count = max(max_points // 2, 1)
+    usable = (y.size // bucket_count) * bucket_count
+    buckets = y[:usable].reshape(bucket_count, -1)
+    offsets = np.arange(bucket_count) * buckets.shape[1]
+    low = offsets + buckets.argmin(axis=1)
+    high = offsets + buckets.argmax(axis=1)
+    tail = np.arange(usable, y.size)
+    return np.unique(np.concatenate([low, high, tail]))
+
+
+def build_model_input(
+    seq: np.ndarray, scaler_scale: float, scaler_min: float, out: np.ndarray
+) -> np.ndarray:
+    flat = out.reshape(-1)
+    np.multiply(seq, scaler_scale, out=flat)
+    flat += scaler_min
+    return out
+
+
+@st.cache_resource
+def build_s3_client():
+    aws_access_key = st.secrets.get("AWS_ACCESS_KEY_ID")
+    aws_secret_key = st.secrets.get("AWS_SECRET_ACCESS_KEY")
+    client_kwargs = {
+        "region_name": "ap-south-2",
+        "config": Config(connect_timeout=2, read_timeout=2, retries={"max_attempts": 1}),
+    }
+    if aws_access_key and aws_secret_key:
+        client_kwargs["aws_access_key_id"] = aws_access_key
+        client_kwargs["aws_secret_access_key"] = aws_secret_key
+
+    return boto3.client("s3", **client_kwargs)
+
+
+@st.cache_data(ttl=5)
+def fetch_object_etag(file_key: str):
+    s3 = build_s3_client()
+    try:
+        return s3.head_object(Bucket=BUCKET_NAME, Key=file_key)["ETag"]
+    except Exception:
+        return None
+
+
+@st.cache_data(max_entries=32)
+def fetch_object(file_key: str, etag: str) -> pd.DataFrame:
+    s3 = build_s3_client()
+    response = s3.get_object(Bucket=BUCKET_NAME, Key=file_key)
+    return read_telemetry_file(response["Body"], file_key)
+
+
+def load_live_data() -> pd.DataFrame:
+    for file_key in FILE_KEYS:
+        try:
+            etag = fetch_object_etag(file_key)
+            if etag is None:
+                continue
+            df = fetch_object(file_key, etag)
+            normalized = normalize_live_data(df)
+            if not normalized.empty:
+                return normalized.tail(50).reset_index(drop=True)
+        except Exception:
+            continue
+
+    for file_path in LOCAL_FALLBACK_FILES:
+        try:
+            df = read_telemetry_file(file_path, file_path)
+            normalized = normalize_live_data(df)
+            if not normalized.empty:
+                return normalized.tail(50).reset_index(drop=True)
+        except Exception:
+            continue
+
+    return pd.DataFrame()
+
+
+def build_keras_predict_fn():
+    model = load_model(MODEL_FILE)
+    concrete = tf.function(
+        model, input_signature=[tf.TensorSpec([1, 60, 1], tf.float32)]
+    ).get_concrete_function()
+
+    def predict(seq_input: np.ndarray) -> np.ndarray:
+        return concrete(tf.constant(seq_input)).numpy()
+
+    return predict
+
+
+@st.cache_resource
+def load_ai_brain():
+    try:
+        scaler = joblib.load("scaler.pkl")
+        scaler_scale = float(scaler.scale_[0])
+        scaler_min = float(scaler.min_[0])
+        predict_fn = build_keras_predict_fn()
+        return predict_fn, scaler_scale, scaler_min
+    except Exception:
+        return None, None, None
+
+
+@st.cache_data
+def generate_report(live_temp: float, prediction: float) -> bytes:
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(200, 10, txt="AETHER MISSION REPORT", ln=True, align="C")
+    pdf.set_font("Arial", "", 12)
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    pdf.cell(200, 10, txt=f"Timestamp: {timestamp}", ln=True, align="C")
+    pdf.ln(10)
+    body_text = (
+        f"Live Temperature: {live_temp:.2f} C\n"
+        f"AI Predicted Next Step: {prediction:.2f} C"
+    )
+    pdf.multi_cell(0, 10, body_text)
+    return pdf.output(dest="S").encode("latin-1")
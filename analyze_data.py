@@ -31,7 +31,7 @@ try:
     print(f"Average Fuel Level: {df['Fuel_Level_%'].mean():.2f}%")
     
     # Check for anomalies (High Temp)
-    high_temp_count = len(df[df['Temperature_C'] > 110])
+    high_temp_count = int((df['Temperature_C'].to_numpy() > 110).sum())
     if high_temp_count > 0:
         print(f"\nWARNING: {high_temp_count} critical temperature spikes detected.")
     else:
@@ -1,25 +1,24 @@
-import datetime
-
-import boto3
-import joblib
 import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
-from botocore.config import Config
-from fpdf import FPDF
-from tensorflow.keras.models import load_model
 
-BUCKET_NAME = "aether-project-data"
-FILE_KEYS = [
-    "live_data.csv",
-    "telemetry_data.csv",
-    "telemetry_batch.csv",
-    "telemetry_batch_1.csv",
-]
-LOCAL_FALLBACK_FILES = [
-    "telemetry_batch_1.csv",
-]
+from aether_core import (
+    build_model_input,
+    build_prediction_sequence,
+    downsample_minmax,
+    generate_report,
+    load_ai_brain,
+    load_live_data,
+    prepare_live_history,
+    prepare_manual_history,
+)
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
 PLOT_CONFIG = {
     "displaylogo": False,
     "displayModeBar": True,
@@ -30,199 +29,6 @@ PLOT_CONFIG = {
 }
 
 
-def normalize_live_data(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
-        return df
-
-    df = df.rename(
-        columns={
-            "Time_Stamp": "Time",
-            "Temperature_C": "Temperature",
-            "Vibration_Hz": "Vibration",
-        }
-    ).copy()
-
-    if "Temperature" not in df.columns:
-        return pd.DataFrame()
-
-    if "Time" not in df.columns:
-        df["Time"] = [f"T-{idx}" for idx in range(len(df), 0, -1)]
-
-    if "Vibration" not in df.columns:
-        df["Vibration"] = np.nan
-
-    df["Temperature"] = pd.to_numeric(df["Temperature"], errors="coerce")
-    df["Vibration"] = pd.to_numeric(df["Vibration"], errors="coerce")
-    df = df.dropna(subset=["Temperature"]).reset_index(drop=True)
-    return df[["Time", "Temperature", "Vibration"]]
-
-
-def build_simulated_data(target_temp: float, points: int = 50) -> pd.DataFrame:
-    end_time = pd.Timestamp.now().floor("s")
-    times = pd.date_range(end=end_time, periods=points, freq="s")
-    normalized_temp = np.clip((target_temp - 80.0) / 70.0, 0.0, 1.0)
-    phase = np.linspace(0, 1, points)
-
-    if target_temp < 95:
-        base_trend = np.linspace(target_temp - 4.0, target_temp, points)
-        wave = np.sin(phase * 2.2 * np.pi) * 0.9
-    elif target_temp < 120:
-        base_trend = np.linspace(target_temp - 7.0, target_temp, points)
-        wave = (
-            np.sin(phase * 3.5 * np.pi) * (1.4 + normalized_temp * 1.2)
-            + np.sin(phase * 8.0 * np.pi) * 0.35
-        )
-    else:
-        base_trend = np.linspace(target_temp - 11.0, target_temp + 2.0, points)
-        spike = np.exp(-((phase - 0.72) ** 2) / 0.003) * (3.0 + normalized_temp * 2.5)
-        wave = np.sin(phase * 5.5 * np.pi) * (2.0 + normalized_temp * 1.5) + spike
-
-    temperature_values = np.round(base_trend + wave, 2).astype(float).tolist()
-    temperature_values[-1] = round(target_temp, 2)
-    vibration_values = 44 + normalized_temp * 18 + np.gradient(temperature_values) * 3.4 + np.cos(phase * 4 * np.pi) * 1.2
-
-    return pd.DataFrame(
-        {
-            "Time": times.strftime("%H:%M:%S"),
-            "Temperature": temperature_values,
-            "Vibration": np.round(np.clip(vibration_values, 35, 75), 2),
-        }
-    )
-
-
-def append_history(history_key: str, incoming: pd.DataFrame, limit: int = 50) -> pd.DataFrame:
-    if incoming.empty:
-        return pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
-
-    history = st.session_state.get(history_key)
-    if history is None or history.empty:
-        history = incoming.copy()
-    else:
-        history = pd.concat([history, incoming], ignore_index=True)
-
-    history["Temperature"] = pd.to_numeric(history["Temperature"], errors="coerce")
-    history["Vibration"] = pd.to_numeric(history["Vibration"], errors="coerce")
-    history = history.dropna(subset=["Temperature"]).tail(limit).reset_index(drop=True)
-    st.session_state[history_key] = history
-    return history
-
-
-def prepare_manual_history(target_temp: float) -> pd.DataFrame:
-    previous_temp = st.session_state.get("manual_target_temp")
-    if previous_temp is None or abs(previous_temp - target_temp) >= 0.25:
-        history = build_simulated_data(target_temp)
-    else:
-        history = st.session_state.get("manual_history")
-        if history is None or history.empty:
-            history = build_simulated_data(target_temp)
-
-    st.session_state["manual_target_temp"] = target_temp
-    st.session_state["manual_history"] = history
-    return history
-
-
-def prepare_live_history(df_cloud: pd.DataFrame) -> pd.DataFrame:
-    if df_cloud.empty:
-        return pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
-
-    latest = df_cloud.tail(min(len(df_cloud), 5)).copy().reset_index(drop=True)
-    current_times = pd.date_range(end=pd.Timestamp.now().floor("s"), periods=len(latest), freq="s")
-    latest["Time"] = current_times.strftime("%H:%M:%S")
-    return append_history("live_history", latest, limit=50)
-
-
-def build_prediction_sequence(df_live: pd.DataFrame, target_temp: float, length: int = 60) -> np.ndarray:
-    if df_live.empty:
-        return np.linspace(target_temp - 5, target_temp, length)
-
-    source = df_live["Temperature"].astype(float).to_numpy()
-    if len(source) == 1:
-        return np.full(length, source[0], dtype=float)
-
-    source_x = np.linspace(0, 1, len(source))
-    target_x = np.linspace(0, 1, length)
-    seq = np.interp(target_x, source_x, source)
-    seq[-1] = target_temp
-    return seq
-
-
-def inject_auto_refresh(enabled: bool, seconds: int) -> None:
-    if not enabled:
-        return
-
-    refresh_ms = max(seconds, 2) * 1000
-    st.markdown(
-        f"""
-        <script>
-        setTimeout(function() {{
-            window.location.reload();
-        }}, {refresh_ms});
-        </script>
-        """,
-        unsafe_allow_html=True,
-    )
-
-
-@st.cache_data(ttl=5)
-def load_live_data() -> pd.DataFrame:
-    aws_access_key = st.secrets.get("AWS_ACCESS_KEY_ID")
-    aws_secret_key = st.secrets.get("AWS_SECRET_ACCESS_KEY")
-    client_kwargs = {
-        "region_name": "ap-south-2",
-        "config": Config(connect_timeout=2, read_timeout=2, retries={"max_attempts": 1}),
-    }
-    if aws_access_key and aws_secret_key:
-        client_kwargs["aws_access_key_id"] = aws_access_key
-        client_kwargs["aws_secret_access_key"] = aws_secret_key
-
-    s3 = boto3.client("s3", **client_kwargs)
-    for file_key in FILE_KEYS:
-        try:
-            response = s3.get_object(Bucket=BUCKET_NAME, Key=file_key)
-            df = pd.read_csv(response["Body"])
-            normalized = normalize_live_data(df)
-            if not normalized.empty:
-                return normalized.tail(50).reset_index(drop=True)
-        except Exception:
-            continue
-
-    for file_path in LOCAL_FALLBACK_FILES:
-        try:
-            df = pd.read_csv(file_path)
-            normalized = normalize_live_data(df)
-            if not normalized.empty:
-                return normalized.tail(50).reset_index(drop=True)
-        except Exception:
-            continue
-
-    return pd.DataFrame()
-
-
-@st.cache_resource
-def load_ai_brain():
-    try:
-        model = load_model("aether_brain_v2.h5")
-        scaler = joblib.load("scaler.pkl")
-        return model, scaler
-    except Exception:
-        return None, None
-
-
-def generate_report(live_temp: float, prediction: float) -> str:
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", "B", 16)
-    pdf.cell(200, 10, txt="AETHER MISSION REPORT", ln=True, align="C")
-    pdf.set_font("Arial", "", 12)
-    pdf.cell(200, 10, txt=f"Timestamp: {datetime.datetime.now()}", ln=True, align="C")
-    pdf.ln(10)
-    pdf.cell(200, 10, txt=f"Live Temperature: {live_temp:.2f} C", ln=True)
-    pdf.cell(200, 10, txt=f"AI Predicted Next Step: {prediction:.2f} C", ln=True)
-    filename = "Mission_Report.pdf"
-    pdf.output(filename)
-    return filename
-
-
 st.set_page_config(page_title="AETHER MASTER", page_icon="rocket", layout="wide")
 st.title("AETHER SYSTEM - MISSION CONTROL")
 st.markdown("### Integrated: Live Cloud Telemetry and Deep Learning AI")
@@ -239,139 +45,184 @@ manual_refresh = st.sidebar.button("Refresh Now")
 if manual_refresh:
     st.cache_data.clear()
 
-inject_auto_refresh(auto_refresh, refresh_seconds)
-
-col1, col2, col3 = st.columns(3)
-
-df_cloud = load_live_data() if use_live_data else pd.DataFrame()
-if use_live_data and not df_cloud.empty:
-    df_live = prepare_live_history(df_cloud)
-    source_name = "LIVE CLOUD"
-elif use_live_data:
-    df_live = pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
-    source_name = "LIVE CLOUD (NO SIGNAL)"
-else:
-    df_live = prepare_manual_history(sim_temp)
-    source_name = "MANUAL SIMULATION"
-
-live_temp_val = 0.0
-if not df_live.empty:
-    live_temp_val = float(df_live["Temperature"].iloc[-1])
-    delta_val = 0.0 if len(df_live) < 2 else live_temp_val - float(df_live["Temperature"].iloc[-2])
-    col1.metric("Current Temp", f"{live_temp_val:.2f} C", f"{delta_val:+.2f} C")
-else:
-    col1.metric("Current Temp", "No Signal")
-
-model = None
-scaler = None
-if enable_ai:
-    ai_status = st.empty()
-    ai_status.info("Loading AI brain...")
-    model, scaler = load_ai_brain()
-    ai_status.empty()
-
-target_temp = live_temp_val if not df_live.empty else sim_temp
-col2.metric("Prediction Source", source_name)
-
-pred_val = None
-seq = build_prediction_sequence(df_live, target_temp, 60)
-if model is not None and scaler is not None:
-    seq_scaled = scaler.transform(pd.DataFrame({"Temperature": seq}))
-    seq_input = seq_scaled.reshape(1, 60, 1)
-    pred_scaled = model.predict(seq_input, verbose=0)
-    pred_val = float(scaler.inverse_transform(pred_scaled)[0][0])
-    trend_label = "RISING" if pred_val > target_temp else "STABLE"
-    col3.metric("AI Predicted (Next 5s)", f"{pred_val:.2f} C", trend_label)
-
-    if pred_val > 120.0:
-        st.error(f"SENTINEL ALERT: AI predicts critical failure ({pred_val:.1f} C)")
-else:
-    col3.metric("AI Predicted (Next 5s)", "Brain Offline")
-
-st.divider()
-c1, c2 = st.columns(2)
 
-if not df_live.empty:
-    telemetry_plot_df = df_live.copy()
-    telemetry_plot_df["Sample"] = np.arange(1, len(telemetry_plot_df) + 1)
-    c1.subheader("Telemetry Trend Analysis")
-    telemetry_fig = px.line(
-        telemetry_plot_df,
-        x="Sample",
-        y="Temperature",
-        title="Engine Temperature Trend (Last 50 Samples)",
-        labels={"Temperature": "Temp (C)", "Sample": "Sample"},
-        markers=True,
-        hover_data={"Time": True, "Vibration": True, "Sample": False},
-    )
-    telemetry_fig.update_layout(
-        template="plotly_dark",
-        dragmode="zoom",
-        xaxis_title="Sample",
-        yaxis_title="Temp (C)",
-    )
-    telemetry_fig.update_xaxes(fixedrange=False)
-    telemetry_fig.update_yaxes(fixedrange=False)
-    c1.plotly_chart(telemetry_fig, width="stretch", config=PLOT_CONFIG)
+def render_mission_panel() -> None:
+    col1, col2, col3 = st.columns(3)
 
-    with st.expander("View Raw Data"):
-        st.dataframe(df_live, width="stretch")
-else:
-    c1.warning("Waiting for telemetry data...")
+    df_cloud = load_live_data() if use_live_data else pd.DataFrame()
+    if use_live_data and not df_cloud.empty:
+        df_live = prepare_live_history(df_cloud)
+        source_name = "LIVE CLOUD"
+    elif use_live_data:
+        df_live = pd.DataFrame(columns=["Time", "Temperature", "Vibration"])
+        source_name = "LIVE CLOUD (NO SIGNAL)"
+    else:
+        df_live = prepare_manual_history(sim_temp)
+        source_name = "MANUAL SIMULATION"
+
+    live_temp_val = 0.0
+    if not df_live.empty:
+        temps = df_live["Temperature"]
+        live_temp_val = float(temps.iat[-1])
+        delta_val = 0.0 if temps.size < 2 else live_temp_val - float(temps.iat[-2])
+        col1.metric("Current Temp", f"{live_temp_val:.2f} C", f"{delta_val:+.2f} C")
+    else:
+        col1.metric("Current Temp", "No Signal")
+
+    predict_fn = None
+    scaler_scale = None
+    scaler_min = None
+    if enable_ai:
+        ai_status = st.empty()
+        ai_status.info("Loading AI brain...")
+        predict_fn, scaler_scale, scaler_min = load_ai_brain()
+        ai_status.empty()
+
+    target_temp = live_temp_val if not df_live.empty else sim_temp
+    col2.metric("Prediction Source", source_name)
+
+    pred_val = None
+    seq = build_prediction_sequence(df_live, target_temp, 60)
+    if predict_fn is not None:
+        seq_buf = st.session_state.get("seq_buf")
+        if seq_buf is None:
+            seq_buf = np.empty((1, 60, 1), np.float32)
+            st.session_state["seq_buf"] = seq_buf
+        seq_input = build_model_input(seq, scaler_scale, scaler_min, seq_buf)
+        pred_scaled = predict_fn(seq_input)
+        pred_val = (float(pred_scaled[0][0]) - scaler_min) / scaler_scale
+        trend_label = "RISING" if pred_val > target_temp else "STABLE"
+        col3.metric("AI Predicted (Next 5s)", f"{pred_val:.2f} C", trend_label)
+
+        if pred_val > 120.0:
+            st.error(f"SENTINEL ALERT: AI predicts critical failure ({pred_val:.1f} C)")
+            if winsound is not None and source_name == "LIVE CLOUD":
+                winsound.Beep(1000, 500)
+    else:
+        col3.metric("AI Predicted (Next 5s)", "Brain Offline")
+
+    st.divider()
+    c1, c2 = st.columns(2)
+
+    if not df_live.empty:
+        c1.subheader("Telemetry Trend Analysis")
+        temperature_arr = df_live["Temperature"].to_numpy(np.float32)
+        sample_arr = np.arange(1, temperature_arr.size + 1, dtype=np.int32)
+        hover_arr = df_live[["Time", "Vibration"]].to_numpy()
+        keep_idx = downsample_minmax(temperature_arr)
+        if keep_idx is not None:
+            temperature_arr = temperature_arr[keep_idx]
+            sample_arr = sample_arr[keep_idx]
+            hover_arr = hover_arr[keep_idx]
+        telemetry_fig = go.Figure(
+            go.Scattergl(
+                x=sample_arr,
+                y=temperature_arr,
+                mode="lines+markers",
+                customdata=hover_arr,
+                hovertemplate=(
+                    "Temp (C)=%{y}<br>Time=%{customdata[0]}"
+                    "<br>Vibration=%{customdata[1]}<extra></extra>"
+                ),
+            )
+        )
+        telemetry_fig.update_layout(
+            title="Engine Temperature Trend (Last 50 Samples)",
+            template="plotly_dark",
+            dragmode="zoom",
+            xaxis_title="Sample",
+            yaxis_title="Temp (C)",
+        )
+        telemetry_fig.update_xaxes(fixedrange=False)
+        telemetry_fig.update_yaxes(fixedrange=False)
+        c1.plotly_chart(telemetry_fig, width="stretch", config=PLOT_CONFIG)
 
-if model is not None and scaler is not None:
-    c2.subheader("AI Trend Simulation")
-    df_sim = pd.DataFrame({"Sequence": np.arange(1, 61), "Temp": seq})
-    ai_fig = px.line(
-        df_sim,
-        x="Sequence",
-        y="Temp",
-        title=f"AI Input Sequence Ending at {target_temp:.2f} C",
-        markers=True,
-    )
-    ai_fig.update_layout(template="plotly_dark", dragmode="zoom")
-    ai_fig.update_xaxes(fixedrange=False)
-    ai_fig.update_yaxes(fixedrange=False)
-    c2.plotly_chart(ai_fig, width="stretch", config=PLOT_CONFIG)
-else:
-    c2.info("Enable the AI brain from the sidebar to load the prediction model.")
+        with st.expander("View Raw Data"):
+            st.dataframe(df_live, width="stretch")
+    else:
+        c1.warning("Waiting for telemetry data...")
+
+    if predict_fn is not None:
+        c2.subheader("AI Trend Simulation")
+        df_sim = pd.DataFrame({"Sequence": np.arange(1, 61), "Temp": seq})
+        ai_fig = go.Figure(
+            go.Scattergl(
+                x=df_sim["Sequence"].to_numpy(np.int32),
+                y=df_sim["Temp"].to_numpy(np.float32),
+                mode="lines+markers",
+            )
+        )
+        ai_fig.update_layout(
+            title=f"AI Input Sequence Ending at {target_temp:.2f} C",
+            template="plotly_dark",
+            dragmode="zoom",
+            xaxis_title="Sequence",
+            yaxis_title="Temp",
+        )
+        ai_fig.update_xaxes(fixedrange=False)
+        ai_fig.update_yaxes(fixedrange=False)
+        c2.plotly_chart(ai_fig, width="stretch", config=PLOT_CONFIG)
+    else:
+        c2.info("Enable the AI brain from the sidebar to load the prediction model.")
 
-st.divider()
-if st.button("Generate Mission Report"):
-    if pred_val is not None:
-        pdf_file = generate_report(live_temp_val, pred_val)
-        with open(pdf_file, "rb") as file_handle:
+    st.divider()
+    if st.button("Generate Mission Report"):
+        if pred_val is not None:
+            pdf_bytes = generate_report(round(live_temp_val, 2), round(pred_val, 2))
             st.download_button(
                 label="Download PDF",
-                data=file_handle,
-                file_name=pdf_file,
+                data=pdf_bytes,
+                file_name="Mission_Report.pdf",
                 mime="application/pdf",
             )
-    else:
-        st.warning("Enable the AI brain to generate a report.")
+        else:
+            st.warning("Enable the AI brain to generate a report.")
+
+    if pred_val is not None and not df_live.empty:
+        st.subheader("Future Horizon (Next 5 Seconds)")
+        past_time = np.arange(-len(seq), 0)
+        future_time = np.array([5])
+        df_horizon = pd.DataFrame(
+            {
+                "Time_Seconds": list(past_time) + list(future_time),
+                "Temperature_C": list(seq) + [pred_val],
+                "Type": ["History"] * len(seq) + ["Prediction"],
+            }
+        )
+
+        df_history_part = df_horizon[df_horizon["Type"] == "History"]
+        df_prediction_part = df_horizon[df_horizon["Type"] == "Prediction"]
+        horizon_fig = go.Figure(
+            [
+                go.Scattergl(
+                    x=df_history_part["Time_Seconds"].to_numpy(np.int32),
+                    y=df_history_part["Temperature_C"].to_numpy(np.float32),
+                    mode="lines+markers",
+                    name="History",
+                ),
+                go.Scattergl(
+                    x=df_prediction_part["Time_Seconds"].to_numpy(np.int32),
+                    y=df_prediction_part["Temperature_C"].to_numpy(np.float32),
+                    mode="lines+markers",
+                    name="Prediction",
+                    line={"dash": "dash"},
+                ),
+            ]
+        )
+        horizon_fig.update_layout(
+            title=f"Past to Future (Live {target_temp:.1f} C to Pred {pred_val:.1f} C)",
+            template="plotly_dark",
+            dragmode="zoom",
+            xaxis_title="Time_Seconds",
+            yaxis_title="Temperature_C",
+            legend_title_text="Type",
+        )
+        horizon_fig.update_xaxes(fixedrange=False)
+        horizon_fig.update_yaxes(fixedrange=False)
+        st.plotly_chart(horizon_fig, width="stretch", config=PLOT_CONFIG)
+
 
-if pred_val is not None and not df_live.empty:
-    st.subheader("Future Horizon (Next 5 Seconds)")
-    past_time = np.arange(-len(seq), 0)
-    future_time = np.array([5])
-    df_horizon = pd.DataFrame(
-        {
-            "Time_Seconds": list(past_time) + list(future_time),
-            "Temperature_C": list(seq) + [pred_val],
-            "Type": ["History"] * len(seq) + ["Prediction"],
-        }
-    )
+if auto_refresh:
+    render_mission_panel = st.fragment(run_every=refresh_seconds)(render_mission_panel)
 
-    horizon_fig = px.line(
-        df_horizon,
-        x="Time_Seconds",
-        y="Temperature_C",
-        color="Type",
-        line_dash="Type",
-        title=f"Past to Future (Live {target_temp:.1f} C to Pred {pred_val:.1f} C)",
-        markers=True,
-    )
-    horizon_fig.update_layout(template="plotly_dark", dragmode="zoom")
-    horizon_fig.update_xaxes(fixedrange=False)
-    horizon_fig.update_yaxes(fixedrange=False)
-    st.plotly_chart(horizon_fig, width="stretch", config=PLOT_CONFIG)
+render_mission_panel()
@@ -0,0 +1,35 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import boto3
+
+print("--- AETHER: CSV TO PARQUET CONVERTER ---")
+
+# 1. CONFIGURATION
+bucket_name = 'aether-project-data'
+csv_filename = 'telemetry_batch_1.csv'
+parquet_filename = 'telemetry_batch_1.parquet'
+
+# 2. CONVERT LOCALLY
+# Parquet is columnar + Snappy compressed: ~5-10x fewer bytes than CSV
+# and no string-to-float parsing when the dashboard reads it back.
+df = pd.read_csv(csv_filename)
+table = pa.Table.from_pandas(df, preserve_index=False)
+pq.write_table(table, parquet_filename, compression='snappy')
+
+print(f"Converted '{csv_filename}' ({len(df)} rows) to '{parquet_filename}'")
+
+# 3. UPLOAD TO AWS S3
+try:
+    s3 = boto3.client('s3')
+
+    print(f"Uploading to bucket: {bucket_name}...")
+    s3.upload_file(parquet_filename, bucket_name, parquet_filename)
+
+    print("\n*** SUCCESS ***")
+    print(f"File '{parquet_filename}' has been uploaded to bucket '{bucket_name}'.")
+
+except Exception as e:
+    print("\n*** ERROR ***")
+    print(f"Could not upload file. Reason: {e}")
+    print("The local parquet file is still available for the dashboard fallback.")